@@ -5,32 +5,30 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+import re
+from typing import Collection
 
+# One KEY=VALUE line; comments and lines without a key never match. Surrounding
+# whitespace (as str.strip sees it) is trimmed, and a value wrapped in matching
+# single or double quotes is captured without them.
+_ENV_LINE_RE = re.compile(r"""\s*([^#=\s][^=]*?)\s*=\s*(?:"(.*)"|'(.*)'|(.*?))\s*""")
 
-def _strip_optional_quotes(value: str) -> str:
-    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
-        return value[1:-1]
-    return value
 
-
-def load_env_file(env_file: str = ".env") -> None:
+def load_env_file(env_file: str = ".env", override: Collection[str] = ()) -> None:
     """Load environment variables from a simple KEY=VALUE file if present.
 
-    Existing environment variables take precedence and are never overwritten.
+    Existing environment variables take precedence and are never overwritten,
+    except for keys listed in ``override`` (used when reloading a changed file).
     """
     env_path = Path(env_file)
     if not env_path.exists():
         return
 
-    for raw_line in env_path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
+    for line in env_path.read_text(encoding="utf-8").splitlines():
+        match = _ENV_LINE_RE.fullmatch(line)
+        if match is None:
             continue
-
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = _strip_optional_quotes(value.strip())
-        if key and key not in os.environ:
+        key = match.group(1)
+        value = match.group(2) or match.group(3) or match.group(4) or ""
+        if key in override or key not in os.environ:
             os.environ[key] = value
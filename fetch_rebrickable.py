@@ -4,17 +4,36 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 import json
 import os
-import ssl
 import sys
+import time
 from typing import Any
 import urllib.parse
-import urllib.request
+
+import urllib3
 
 from config_utils import load_env_file
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 BASE_URL = "https://rebrickable.com/api/v3"
+CACHE_TTL_SECONDS = 24 * 60 * 60
+CONNECT_TIMEOUT_SECONDS = 5
+READ_TIMEOUT_SECONDS = 30
+
+
+class RebrickableHTTPError(Exception):
+    """Raised when the API answers with a non-success HTTP status."""
+
+    def __init__(self, status: int, detail: str) -> None:
+        super().__init__(f"HTTP error {status}: {detail}")
+        self.status = status
+        self.detail = detail
 
 
 def build_url(path: str, params: dict[str, str]) -> str:
@@ -34,19 +53,95 @@ def _skip_ssl_verify_enabled() -> bool:
     }
 
 
-def fetch_json(url: str, api_key: str) -> dict[str, Any]:
-    request = urllib.request.Request(
+# Reused stdlib encoders for when orjson is unavailable; json.dumps would build
+# a new encoder on every call with these options. Output matches orjson's.
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=False)
+_COMPACT_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads_json(payload: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def dumps_json(data: Any, indent: bool = True) -> str:
+    """Serialize with sorted keys, using orjson when it is installed."""
+    if orjson is not None:
+        return dumps_json_bytes(data, indent).decode("utf-8")
+    return (_PRETTY_ENCODER if indent else _COMPACT_ENCODER).encode(data)
+
+
+def dumps_json_bytes(data: Any, indent: bool = True) -> bytes:
+    """Like dumps_json, but UTF-8 bytes ready to write to a socket or file."""
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return (_PRETTY_ENCODER if indent else _COMPACT_ENCODER).encode(data).encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def _http_pool() -> urllib3.PoolManager:
+    """Process-wide connection pool so repeat calls reuse keep-alive sockets.
+
+    Created lazily so REBRICKABLE_SKIP_SSL_VERIFY from a .env file is honoured.
+    Timeouts keep a stalled upstream socket from holding a worker forever.
+    """
+    skip_verify = _skip_ssl_verify_enabled()
+    if skip_verify:
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return urllib3.PoolManager(
+        maxsize=16,
+        cert_reqs="CERT_NONE" if skip_verify else "CERT_REQUIRED",
+        retries=urllib3.Retry(total=2, backoff_factor=0.2),
+        timeout=urllib3.Timeout(connect=CONNECT_TIMEOUT_SECONDS, read=READ_TIMEOUT_SECONDS),
+    )
+
+
+def cache_epoch() -> int:
+    """Current cache generation; it changes every CACHE_TTL_SECONDS.
+
+    Passing it as an extra lru_cache argument makes stale entries miss and
+    age out of the cache, without tracking a timestamp per entry.
+    """
+    return int(time.monotonic() // CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=4096)
+def _fetch_payload(url: str, api_key: str, epoch: int) -> bytes:
+    """Return the raw response body, memoized per URL, key and cache epoch.
+
+    Part and color metadata changes rarely, so it is refetched at most once
+    per CACHE_TTL_SECONDS. Raw bytes are cached so each caller parses its
+    own copy and can mutate it freely; failed requests raise and are never
+    cached.
+    """
+    response = _http_pool().request(
+        "GET",
         url,
-        headers={"Authorization": f"key {api_key}", "Accept": "application/json"},
+        headers={
+            "Authorization": f"key {api_key}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        },
+        preload_content=False,
     )
+    try:
+        # Read the (decompressed) body once; orjson parses these bytes directly.
+        payload = response.read(decode_content=True)
+    finally:
+        response.release_conn()
+
+    if response.status >= 400:
+        raise RebrickableHTTPError(
+            response.status,
+            payload.decode("utf-8", errors="replace"),
+        )
+    return payload
 
-    ssl_context = None
-    if _skip_ssl_verify_enabled():
-        ssl_context = ssl._create_unverified_context()
 
-    with urllib.request.urlopen(request, context=ssl_context) as response:
-        payload = response.read()
-        return json.loads(payload)
+def fetch_json(url: str, api_key: str) -> dict[str, Any]:
+    return loads_json(_fetch_payload(url, api_key, cache_epoch()))
 
 
 def parse_params(param_list: list[str]) -> dict[str, str]:
@@ -117,18 +212,20 @@ def main() -> int:
 
     try:
         data = fetch_path(args.path, params, api_key)
-    except urllib.error.HTTPError as exc:
-        detail = exc.read().decode("utf-8")
-        print(f"HTTP error {exc.code}: {detail}", file=sys.stderr)
+    except RebrickableHTTPError as exc:
+        print(str(exc), file=sys.stderr)
         return 3
-    except ssl.SSLCertVerificationError:
-        print(ssl_fix_hint(), file=sys.stderr)
-        return 5
-    except urllib.error.URLError as exc:
+    except urllib3.exceptions.MaxRetryError as exc:
+        if isinstance(exc.reason, urllib3.exceptions.SSLError):
+            print(ssl_fix_hint(), file=sys.stderr)
+            return 5
         print(f"Network error: {exc.reason}", file=sys.stderr)
         return 4
+    except urllib3.exceptions.HTTPError as exc:
+        print(f"Network error: {exc}", file=sys.stderr)
+        return 4
 
-    output = json.dumps(data, indent=2, sort_keys=True)
+    output = dumps_json(data)
     if args.save:
         with open(args.save, "w", encoding="utf-8") as handle:
             handle.write(output)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""HTML template for the part lookup page, pre-encoded for the web app."""
+
+from __future__ import annotations
+
+PART_VALUE_TOKEN = "__PART_VALUE__"
+CONTENT_TOKEN = "__CONTENT__"
+
+HTML_PAGE = """<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <title>Rebrickable Part Lookup</title>
+    <style>
+      body {
+        font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
+        margin: 2rem;
+        background: #f6f7fb;
+        color: #1f2933;
+      }
+      .container {
+        max-width: 880px;
+        margin: 0 auto;
+        background: white;
+        padding: 2rem;
+        border-radius: 12px;
+        box-shadow: 0 10px 25px rgba(31, 41, 51, 0.08);
+      }
+      h1 {
+        margin-top: 0;
+      }
+      form {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 1rem;
+        margin-bottom: 1.5rem;
+      }
+      input[type="text"] {
+        flex: 1 1 260px;
+        padding: 0.65rem 0.75rem;
+        border: 1px solid #cbd2d9;
+        border-radius: 8px;
+        font-size: 1rem;
+      }
+      button {
+        padding: 0.65rem 1.4rem;
+        background: #2563eb;
+        border: none;
+        color: white;
+        border-radius: 8px;
+        font-size: 1rem;
+        cursor: pointer;
+      }
+      button:hover {
+        background: #1d4ed8;
+      }
+      .status {
+        margin-bottom: 1rem;
+        color: #52616b;
+      }
+      .result-table {
+        width: 100%;
+        border-collapse: collapse;
+        margin-top: 1rem;
+        border: 1px solid #d9e2ec;
+        border-radius: 8px;
+        overflow: hidden;
+      }
+      .result-table th,
+      .result-table td {
+        padding: 0.7rem 0.8rem;
+        text-align: left;
+        border-bottom: 1px solid #d9e2ec;
+        vertical-align: top;
+      }
+      .result-table th {
+        width: 220px;
+        background: #f0f4f8;
+        color: #334e68;
+      }
+      .result-table tr:last-child th,
+      .result-table tr:last-child td {
+        border-bottom: none;
+      }
+      details {
+        margin-top: 1rem;
+      }
+      pre {
+        background: #f0f4f8;
+        padding: 1rem;
+        border-radius: 8px;
+        overflow-x: auto;
+      }
+      .error {
+        color: #b42318;
+      }
+      .color-swatch {
+        display: inline-block;
+        width: 1rem;
+        height: 1rem;
+        border: 1px solid #9aa5b1;
+        border-radius: 4px;
+        vertical-align: middle;
+        margin-right: 0.5rem;
+      }
+    </style>
+  </head>
+  <body>
+    <div class="container">
+      <h1>Rebrickable Part Lookup</h1>
+      <p class="status">Enter a part number to fetch details from the Rebrickable V3 API.</p>
+      <form method="get" action="/">
+        <input
+          type="text"
+          name="part_num"
+          placeholder="e.g. 3001"
+          value="__PART_VALUE__"
+          required
+        />
+        <button type="submit">Look up part</button>
+      </form>
+      __CONTENT__
+    </div>
+    <script>
+      // Raw JSON is served separately and only fetched when a <details> is opened.
+      document.addEventListener(
+        "toggle",
+        function (event) {
+          var details = event.target;
+          if (!details.open || !details.classList || !details.classList.contains("raw-json")) {
+            return;
+          }
+          if (details.dataset.loaded) {
+            return;
+          }
+          details.dataset.loaded = "1";
+          var pre = details.querySelector("pre");
+          fetch(details.dataset.src)
+            .then(function (response) {
+              return response.text();
+            })
+            .then(function (text) {
+              pre.textContent = text;
+            })
+            .catch(function () {
+              pre.textContent = "Failed to load raw JSON.";
+              delete details.dataset.loaded;
+            });
+        },
+        true
+      );
+    </script>
+  </body>
+</html>
+"""
+
+HTML_PAGE_BYTES = HTML_PAGE.encode("utf-8")
+
+# Split once at import so requests only concatenate bytes around the tokens.
+PAGE_PREFIX, _page_rest = HTML_PAGE_BYTES.split(PART_VALUE_TOKEN.encode("utf-8"))
+PAGE_MIDDLE, PAGE_SUFFIX = _page_rest.split(CONTENT_TOKEN.encode("utf-8"))
@@ -3,144 +3,78 @@
 
 from __future__ import annotations
 
-import html
-import json
+import hashlib
 import os
+import re
+import signal
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from http import HTTPStatus
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from typing import Any
-from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import quote, unquote, unquote_plus, urlparse
 
 from config_utils import load_env_file
-from fetch_rebrickable import fetch_path, ssl_fix_hint
+from fetch_rebrickable import (
+    cache_epoch,
+    dumps_json,
+    dumps_json_bytes,
+    fetch_path,
+    ssl_fix_hint,
+)
+from templates import PAGE_MIDDLE, PAGE_PREFIX, PAGE_SUFFIX
+
+try:
+    from markupsafe import escape as _markup_escape
+except ImportError:  # pragma: no cover - optional speedup
+    _markup_escape = None
 
 
-PART_VALUE_TOKEN = "__PART_VALUE__"
-CONTENT_TOKEN = "__CONTENT__"
 ENV_FILE = os.environ.get("REBRICKABLE_ENV_FILE", ".env")
+FETCH_WORKERS = 8
+COLOR_LOOKUP_WORKERS = 8
+RAW_JSON_PREFIX = "/raw/"
+RAW_JSON_SUFFIX = ".json"
+
+_HEX3_RE = re.compile(r"\A[0-9A-Fa-f]{3}\Z")
+_HEX6_RE = re.compile(r"\A[0-9A-Fa-f]{6}\Z")
+
+_API_KEY: str | None = None
+
+# Shared by request threads to overlap the part and colors calls of a page.
+# Per-page color lookups use their own pool so one cold page cannot queue
+# ahead of other clients' requests.
+_FETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=FETCH_WORKERS,
+    thread_name_prefix="rebrickable-fetch",
+)
+
+# Like html.escape(quote=True), but one str.translate pass instead of chained
+# str.replace calls. '>' is left alone: with '<' escaped it cannot open a tag,
+# and inside quoted attributes only the quote characters matter.
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", '"': "&quot;", "'": "&#x27;"})
+
+_needs_escape = re.compile(r"[&<\"']").search
+
 
-HTML_PAGE = """<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="utf-8" />
-    <meta name="viewport" content="width=device-width, initial-scale=1" />
-    <title>Rebrickable Part Lookup</title>
-    <style>
-      body {
-        font-family: "Segoe UI", Tahoma, Geneva, Verdana, sans-serif;
-        margin: 2rem;
-        background: #f6f7fb;
-        color: #1f2933;
-      }
-      .container {
-        max-width: 880px;
-        margin: 0 auto;
-        background: white;
-        padding: 2rem;
-        border-radius: 12px;
-        box-shadow: 0 10px 25px rgba(31, 41, 51, 0.08);
-      }
-      h1 {
-        margin-top: 0;
-      }
-      form {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 1rem;
-        margin-bottom: 1.5rem;
-      }
-      input[type="text"] {
-        flex: 1 1 260px;
-        padding: 0.65rem 0.75rem;
-        border: 1px solid #cbd2d9;
-        border-radius: 8px;
-        font-size: 1rem;
-      }
-      button {
-        padding: 0.65rem 1.4rem;
-        background: #2563eb;
-        border: none;
-        color: white;
-        border-radius: 8px;
-        font-size: 1rem;
-        cursor: pointer;
-      }
-      button:hover {
-        background: #1d4ed8;
-      }
-      .status {
-        margin-bottom: 1rem;
-        color: #52616b;
-      }
-      .result-table {
-        width: 100%;
-        border-collapse: collapse;
-        margin-top: 1rem;
-        border: 1px solid #d9e2ec;
-        border-radius: 8px;
-        overflow: hidden;
-      }
-      .result-table th,
-      .result-table td {
-        padding: 0.7rem 0.8rem;
-        text-align: left;
-        border-bottom: 1px solid #d9e2ec;
-        vertical-align: top;
-      }
-      .result-table th {
-        width: 220px;
-        background: #f0f4f8;
-        color: #334e68;
-      }
-      .result-table tr:last-child th,
-      .result-table tr:last-child td {
-        border-bottom: none;
-      }
-      details {
-        margin-top: 1rem;
-      }
-      pre {
-        background: #f0f4f8;
-        padding: 1rem;
-        border-radius: 8px;
-        overflow-x: auto;
-      }
-      .error {
-        color: #b42318;
-      }
-      .color-swatch {
-        display: inline-block;
-        width: 1rem;
-        height: 1rem;
-        border: 1px solid #9aa5b1;
-        border-radius: 4px;
-        vertical-align: middle;
-        margin-right: 0.5rem;
-      }
-    </style>
-  </head>
-  <body>
-    <div class="container">
-      <h1>Rebrickable Part Lookup</h1>
-      <p class="status">Enter a part number to fetch details from the Rebrickable V3 API.</p>
-      <form method="get" action="/">
-        <input
-          type="text"
-          name="part_num"
-          placeholder="e.g. 3001"
-          value="__PART_VALUE__"
-          required
-        />
-        <button type="submit">Look up part</button>
-      </form>
-      __CONTENT__
-    </div>
-  </body>
-</html>
-"""
+def _esc(value: str) -> str:
+    """HTML-escape text (quotes included), using markupsafe's C speedups if available."""
+    # Most labels, ids and URLs contain nothing to escape; return those untouched.
+    if not _needs_escape(value):
+        return value
+    if _markup_escape is not None:
+        return str(_markup_escape(value))
+    return value.translate(_ESCAPE_TABLE)
 
 
 def _fmt(value: Any) -> str:
+    # Exact type checks first: plain str/int are by far the most common values.
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is int:
+        return str(value)
     if value is None:
         return ""
     if isinstance(value, bool):
@@ -148,7 +82,7 @@ def _fmt(value: Any) -> str:
     if isinstance(value, (list, tuple)):
         return ", ".join(str(item) for item in value)
     if isinstance(value, dict):
-        return json.dumps(value, sort_keys=True)
+        return dumps_json(value, indent=False)
     return str(value)
 
 
@@ -164,25 +98,30 @@ def _first_present(entry: dict[str, Any], keys: list[str]) -> Any:
             return entry.get(key)
     return None
 
-def _color_field(color_entry: dict[str, Any], field: str) -> str:
+# Alternate key names seen in some payloads
+_COLOR_FIELD_ALIASES: dict[str, tuple[str, ...]] = {
+    "id": ("color_id", "id_color", "colour_id"),
+    "name": ("color_name", "colour_name"),
+    "rgb": ("color_rgb", "rgb_hex", "hex", "colour_rgb"),
+}
+
+
+def _lookup_color_field(
+    color_entry: dict[str, Any],
+    nested: dict[str, Any] | None,
+    field: str,
+) -> str:
     """Best-effort extraction for color fields across API payload shapes."""
     value = color_entry.get(field)
     if value not in (None, ""):
         return _fmt(value)
 
-    nested = color_entry.get("color")
-    if isinstance(nested, dict):
+    if nested is not None:
         nested_value = nested.get(field)
         if nested_value not in (None, ""):
             return _fmt(nested_value)
 
-    # Alternate key names seen in some payloads
-    aliases = {
-        "id": ["color_id", "id_color", "colour_id"],
-        "name": ["color_name", "colour_name"],
-        "rgb": ["color_rgb", "rgb_hex", "hex", "colour_rgb"],
-    }
-    for alias in aliases.get(field, []):
+    for alias in _COLOR_FIELD_ALIASES.get(field, ()):
         alias_val = color_entry.get(alias)
         if alias_val not in (None, ""):
             return _fmt(alias_val)
@@ -190,118 +129,164 @@ def _color_field(color_entry: dict[str, Any], field: str) -> str:
     return ""
 
 
+def _nested_color(color_entry: dict[str, Any]) -> dict[str, Any] | None:
+    nested = color_entry.get("color")
+    return nested if isinstance(nested, dict) else None
+
 
+def _color_fields(color_entry: dict[str, Any]) -> tuple[str, str, str]:
+    """Extract (id, name, rgb) while resolving the nested color only once."""
+    nested = _nested_color(color_entry)
+    return (
+        _lookup_color_field(color_entry, nested, "id"),
+        _lookup_color_field(color_entry, nested, "name"),
+        _lookup_color_field(color_entry, nested, "rgb"),
+    )
+
+
+@lru_cache(maxsize=1024)
 def _normalize_rgb(value: str) -> str:
+    # Rebrickable only has a few hundred colors, so results are memoized.
     rgb = value.strip().lstrip("#")
-    if len(rgb) == 3:
-        rgb = "".join(ch * 2 for ch in rgb)
-    if len(rgb) != 6:
-        return ""
-    if any(ch not in "0123456789abcdefABCDEF" for ch in rgb):
+    if _HEX3_RE.match(rgb):
+        rgb = rgb[0] * 2 + rgb[1] * 2 + rgb[2] * 2
+    elif not _HEX6_RE.match(rgb):
         return ""
     return rgb.upper()
 
 def _safe_link(url: str, label: str) -> str:
-    safe_url = html.escape(url, quote=True)
-    safe_label = html.escape(label)
+    safe_url = _esc(url)
+    safe_label = _esc(label)
     return (
         f'<a href="{safe_url}" target="_blank" rel="noopener noreferrer">'
         f"{safe_label}</a>"
     )
 
 
-def _external_url(source: str, ext_id: str) -> str | None:
-    source_key = source.strip().lower()
-    if source_key == "bricklink":
-        return f"https://www.bricklink.com/v2/catalog/catalogitem.page?P={ext_id}"
-    if source_key == "brickowl":
-        return f"https://www.brickowl.com/catalog/lego-part-{ext_id}"
-    if source_key == "lego":
-        return f"https://www.lego.com/en-us/pick-and-build/pick-a-brick?query={ext_id}"
-    if source_key == "ldraw":
-        return f"https://library.ldraw.org/library/unofficial/{ext_id}.dat"
-    if source_key == "brickset":
-        return f"https://brickset.com/parts/design-{ext_id}"
-    return None
+_EXTERNAL_URL_TEMPLATES = {
+    "bricklink": "https://www.bricklink.com/v2/catalog/catalogitem.page?P={}",
+    "brickowl": "https://www.brickowl.com/catalog/lego-part-{}",
+    "lego": "https://www.lego.com/en-us/pick-and-build/pick-a-brick?query={}",
+    "ldraw": "https://library.ldraw.org/library/unofficial/{}.dat",
+    "brickset": "https://brickset.com/parts/design-{}",
+}
+
+
+def _external_url(source_key: str, ext_id: str) -> str | None:
+    """URL for ext_id; source_key must already be stripped and lowercased."""
+    template = _EXTERNAL_URL_TEMPLATES.get(source_key)
+    return template.format(ext_id) if template else None
 
 
 def _render_external_ids_html(external_ids: dict[str, Any]) -> str:
     chunks: list[str] = []
     for source, raw_ids in external_ids.items():
         ids = raw_ids if isinstance(raw_ids, list) else [raw_ids]
+        source_key = str(source).strip().lower()
         links: list[str] = []
         for item in ids:
             id_text = str(item)
-            url = _external_url(source, id_text)
+            url = _external_url(source_key, id_text)
             if url:
                 links.append(_safe_link(url, id_text))
             else:
-                links.append(html.escape(id_text))
+                links.append(_esc(id_text))
 
         if links:
-            safe_source = html.escape(str(source))
+            safe_source = _esc(str(source))
             chunks.append(f"<div><strong>{safe_source}:</strong> {', '.join(links)}</div>")
 
     return "".join(chunks)
 
-def render_part_table(part: dict[str, Any], colors_payload: dict[str, Any] | None = None) -> str:
+def raw_json_path(part_num: str) -> str:
+    return f"{RAW_JSON_PREFIX}{quote(part_num, safe='')}{RAW_JSON_SUFFIX}"
+
+
+def _field_cell(key: str) -> Callable[[dict[str, Any]], str]:
+    def cell(part: dict[str, Any]) -> str:
+        return _esc(_fmt(part.get(key)))
+
+    return cell
+
+
+def _category_cell(part: dict[str, Any]) -> str:
+    return _esc(_fmt((part.get("part_cat") or {}).get("name")))
+
+
+def _part_url_cell(part: dict[str, Any]) -> str:
     part_url = _fmt(part.get("part_url"))
-    part_url_html = _safe_link(part_url, part_url) if part_url else ""
-
-    rows: list[tuple[str, str, bool]] = [
-        ("Part Number", _fmt(part.get("part_num")), False),
-        ("Name", _fmt(part.get("name")), False),
-        ("Category", _fmt((part.get("part_cat") or {}).get("name")), False),
-        ("Part URL", part_url_html, True),
-        ("Print of", _fmt(part.get("print_of")), False),
-        ("Part Material", _fmt(part.get("part_material")), False),
-        ("Year From", _fmt(part.get("year_from")), False),
-        ("Year To", _fmt(part.get("year_to")), False),
-    ]
+    return _safe_link(part_url, part_url) if part_url else ""
 
+
+def _external_ids_cell(part: dict[str, Any]) -> str:
     external_ids = part.get("external_ids")
     if isinstance(external_ids, dict) and external_ids:
-        rows.append(("External IDs", _render_external_ids_html(external_ids), True))
-
-    table_rows = "".join(
-        "<tr>"
-        f"<th>{html.escape(label)}</th>"
-        f"<td>{value if is_html else html.escape(value)}</td>"
-        "</tr>"
-        for label, value, is_html in rows
-        if value
-    )
+        return _render_external_ids_html(external_ids)
+    return ""
 
-    part_img_url = _fmt(part.get("part_img_url"))
-    image_html = ""
+
+# Row labels are constants, so each row's opening <tr><th> is built once at
+# import; per request only the (already escaped) value cell is rendered.
+_PART_ROWS: tuple[tuple[str, Callable[[dict[str, Any]], str]], ...] = tuple(
+    (f"<tr><th>{_esc(label)}</th>", cell)
+    for label, cell in (
+        ("Part Number", _field_cell("part_num")),
+        ("Name", _field_cell("name")),
+        ("Category", _category_cell),
+        ("Part URL", _part_url_cell),
+        ("Print of", _field_cell("print_of")),
+        ("Part Material", _field_cell("part_material")),
+        ("Year From", _field_cell("year_from")),
+        ("Year To", _field_cell("year_to")),
+        ("External IDs", _external_ids_cell),
+    )
+)
+
+
+# Static fragments are kept as bytes so rendered HTML never needs a final
+# whole-document encode; only the dynamic pieces are encoded.
+_PART_TABLE_OPEN = b'<h2 style="margin-bottom:0.4rem;">Part details</h2><table class="result-table">'
+_PART_TABLE_CLOSE = b"</table>"
+_RAW_JSON_DETAILS = (
+    '<details class="raw-json" data-src="{url}"><summary>Show raw JSON</summary>'
+    '<p><a href="{url}" target="_blank" rel="noopener noreferrer">Open raw JSON</a></p>'
+    "<pre>Loading...</pre>"
+    "</details>"
+)
+
+
+def render_part_table(
+    part: dict[str, Any],
+    colors_payload: dict[str, Any] | None = None,
+) -> bytes:
+    get = part.get
+    part_num = _fmt(get("part_num"))
+
+    chunks: list[bytes] = [_PART_TABLE_OPEN]
+    append = chunks.append
+    for row_open, cell in _PART_ROWS:
+        value = cell(part)
+        if value:
+            append(f"{row_open}<td>{value}</td></tr>".encode("utf-8"))
+    append(_PART_TABLE_CLOSE)
+
+    part_img_url = _fmt(get("part_img_url"))
     if part_img_url:
-        safe_img_url = html.escape(part_img_url, quote=True)
+        safe_img_url = _esc(part_img_url)
         image_html = (
             '<div style="margin-top:1rem;">'
             '<h3 style="margin-bottom:0.5rem;">Part image</h3>'
-            f'<img src="{safe_img_url}" alt="Part image for {html.escape(_fmt(part.get("part_num")))}" '
+            f'<img src="{safe_img_url}" alt="Part image for {_esc(part_num)}" '
             'style="max-width:100%; height:auto; border:1px solid #d9e2ec; border-radius:8px;" />'
             "</div>"
         )
+        append(image_html.encode("utf-8"))
 
-    colors_html = render_colors_table(part, colors_payload) if colors_payload else ""
-
-    raw_json = html.escape(json.dumps(part, indent=2, sort_keys=True), quote=False)
-    return (
-        '<h2 style="margin-bottom:0.4rem;">Part details</h2>'
-        '<table class="result-table">'
-        f"{table_rows}"
-        "</table>"
-        f"{image_html}"
-        f"{colors_html}"
-        "<details><summary>Show raw JSON</summary>"
-        f"<pre>{raw_json}</pre>"
-        "</details>"
-    )
-
-
-
+    if colors_payload:
+        append(render_colors_table(part, colors_payload))
 
+    append(_RAW_JSON_DETAILS.format(url=_esc(raw_json_path(part_num))).encode("utf-8"))
+    return b"".join(chunks)
 
 
 def enrich_colors_with_rgb(
@@ -313,157 +298,347 @@ def enrich_colors_with_rgb(
     if not isinstance(results, list):
         return colors_payload
 
-    rgb_cache: dict[str, str] = {}
+    missing: list[tuple[dict[str, Any], str]] = []
     for entry in results:
         if not isinstance(entry, dict):
             continue
-        if _color_field(entry, "rgb"):
+        nested = _nested_color(entry)
+        if _lookup_color_field(entry, nested, "rgb"):
             continue
 
-        color_id = _color_field(entry, "id")
-        if not color_id:
-            continue
+        color_id = _lookup_color_field(entry, nested, "id")
+        if color_id:
+            missing.append((entry, color_id))
+
+    if not missing:
+        return colors_payload
 
-        if color_id not in rgb_cache:
+    color_ids = {color_id for _, color_id in missing}
+    rgb_cache: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(COLOR_LOOKUP_WORKERS, len(color_ids))) as executor:
+        futures = {
+            color_id: executor.submit(fetch_path, f"lego/colors/{color_id}/", {}, api_key)
+            for color_id in color_ids
+        }
+        for color_id, future in futures.items():
             try:
-                color_data = fetch_path(f"lego/colors/{color_id}/", {}, api_key)
-                rgb_cache[color_id] = _fmt(color_data.get("rgb"))
+                rgb_cache[color_id] = _fmt(future.result().get("rgb"))
             except Exception:
                 rgb_cache[color_id] = ""
 
+    for entry, color_id in missing:
         rgb_value = rgb_cache[color_id]
         if rgb_value:
             entry["rgb"] = rgb_value
 
     return colors_payload
 
-def render_colors_table(part: dict[str, Any], colors_payload: dict[str, Any]) -> str:
-    results = colors_payload.get("results")
-    if not isinstance(results, list) or not results:
-        return "<p>No available colors returned for this part.</p>"
+_NUM_SETS_KEYS = ["num_sets", "sets", "set_count"]
+_NUM_PARTS_KEYS = ["num_parts", "parts", "part_count", "quantity", "num_set_parts"]
 
-    part_url = _fmt(part.get("part_url")).rstrip("/")
 
-    rows: list[str] = []
-    for color_entry in results:
-        if not isinstance(color_entry, dict):
-            continue
+class _ColorRow:
+    """Display fields for one color entry, extracted in a single pass."""
 
-        color_id = _color_field(color_entry, "id")
-        color_name = _color_field(color_entry, "name")
-        rgb = _color_field(color_entry, "rgb")
+    __slots__ = ("id", "name", "rgb", "num_sets", "num_parts")
 
-        num_sets = _fmt(
-            _first_present(
-                color_entry,
-                ["num_sets", "sets", "set_count"],
-            )
-        )
-        num_parts = _fmt(
-            _first_present(
-                color_entry,
-                ["num_parts", "parts", "part_count", "quantity", "num_set_parts"],
-            )
-        )
+    def __init__(
+        self,
+        color_id: str,
+        name: str,
+        rgb: str,
+        num_sets: str,
+        num_parts: str,
+    ) -> None:
+        self.id = color_id
+        self.name = name
+        self.rgb = rgb
+        self.num_sets = num_sets
+        self.num_parts = num_parts
 
-        if not color_id and not color_name and not rgb and not num_sets and not num_parts:
-            continue
 
-        color_name_html = html.escape(color_name)
-        if part_url and color_id and color_name:
-            color_url = f"{part_url}/{color_id}/"
-            color_name_html = _safe_link(color_url, color_name)
+def _color_row(color_entry: dict[str, Any]) -> _ColorRow | None:
+    color_id, color_name, rgb = _color_fields(color_entry)
+    num_sets = _fmt(_first_present(color_entry, _NUM_SETS_KEYS))
+    num_parts = _fmt(_first_present(color_entry, _NUM_PARTS_KEYS))
+    if not color_id and not color_name and not rgb and not num_sets and not num_parts:
+        return None
+    return _ColorRow(color_id, color_name, rgb, num_sets, num_parts)
+
+
+_NO_COLORS_HTML = b"<p>No available colors returned for this part.</p>"
+_COLORS_TABLE_OPEN = (
+    b'<h3 style="margin-top:1.5rem; margin-bottom:0.5rem;">Available colors</h3>'
+    b'<table class="result-table">'
+    b"<thead><tr><th>ID</th><th>Color</th><th>RGB</th><th>Sets</th><th>Parts</th></tr></thead>"
+    b"<tbody>"
+)
+_COLORS_TABLE_CLOSE = b"</tbody></table>"
+_COLOR_ROW_TEMPLATE = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+
 
-        normalized_rgb = _normalize_rgb(rgb)
+def render_colors_table(part: dict[str, Any], colors_payload: dict[str, Any]) -> bytes:
+    results = colors_payload.get("results")
+    if not isinstance(results, list) or not results:
+        return _NO_COLORS_HTML
+
+    part_url = _fmt(part.get("part_url")).rstrip("/")
+
+    color_rows = [
+        row
+        for row in (_color_row(entry) for entry in results if isinstance(entry, dict))
+        if row is not None
+    ]
+
+    rows: list[bytes] = []
+    for row in color_rows:
+        color_name_html = _esc(row.name)
+        if part_url and row.id and row.name:
+            color_url = f"{part_url}/{row.id}/"
+            color_name_html = _safe_link(color_url, row.name)
+
+        normalized_rgb = _normalize_rgb(row.rgb)
         swatch = ""
-        rgb_text = html.escape(rgb)
+        rgb_text = _esc(row.rgb)
         if normalized_rgb:
-            safe_rgb = html.escape(normalized_rgb, quote=True)
+            safe_rgb = _esc(normalized_rgb)
             swatch = f'<span class="color-swatch" style="background-color: #{safe_rgb};"></span>'
-            rgb_text = f"{swatch}#{html.escape(normalized_rgb)}"
+            rgb_text = f"{swatch}#{_esc(normalized_rgb)}"
 
         rows.append(
-            "<tr>"
-            f"<td>{html.escape(color_id)}</td>"
-            f"<td>{color_name_html}</td>"
-            f"<td>{rgb_text}</td>"
-            f"<td>{html.escape(num_sets)}</td>"
-            f"<td>{html.escape(num_parts)}</td>"
-            "</tr>"
+            _COLOR_ROW_TEMPLATE.format(
+                _esc(row.id),
+                color_name_html,
+                rgb_text,
+                _esc(row.num_sets),
+                _esc(row.num_parts),
+            ).encode("utf-8")
         )
 
     if not rows:
-        return "<p>No available colors returned for this part.</p>"
+        return _NO_COLORS_HTML
 
-    return (
-        '<h3 style="margin-top:1.5rem; margin-bottom:0.5rem;">Available colors</h3>'
-        '<table class="result-table">'
-        '<thead><tr><th>ID</th><th>Color</th><th>RGB</th><th>Sets</th><th>Parts</th></tr></thead>'
-        f"<tbody>{''.join(rows)}</tbody>"
-        "</table>"
-    )
+    return b"".join((_COLORS_TABLE_OPEN, *rows, _COLORS_TABLE_CLOSE))
 
 
-def render_page(part_num: str, content: str) -> str:
-    """Render the HTML page without calling str.format on CSS braces."""
-    return (
-        HTML_PAGE.replace(PART_VALUE_TOKEN, html.escape(part_num))
-        .replace(CONTENT_TOKEN, content)
-    )
+def _api_key() -> str | None:
+    """Load .env once and remember the API key for later requests."""
+    global _API_KEY
+    if _API_KEY is None:
+        load_env_file(ENV_FILE)
+        _API_KEY = os.environ.get("REBRICKABLE_API_KEY") or None
+    return _API_KEY
+
+
+def _reload_env(signum: int, frame: Any) -> None:
+    """SIGHUP handler: re-read .env so a changed API key applies without a restart.
+
+    Only REBRICKABLE_API_KEY is replaced; other variables keep their current
+    values. If the file cannot be read, the previous key stays in use.
+    """
+    global _API_KEY
+    try:
+        load_env_file(ENV_FILE, override=("REBRICKABLE_API_KEY",))
+    except (OSError, UnicodeDecodeError) as exc:
+        print(f"Could not reload {ENV_FILE}: {exc}", file=sys.stderr)
+        return
+    _API_KEY = os.environ.get("REBRICKABLE_API_KEY") or None
+
+
+@lru_cache(maxsize=256)
+def _raw_json_bytes(part_num: str, api_key: str, epoch: int) -> bytes:
+    """Pretty-printed part payload, memoized so repeat views skip serialization."""
+    data = fetch_path(f"lego/parts/{part_num}/", {}, api_key)
+    return dumps_json_bytes(data)
+
+
+def render_page_parts(part_num: str, content: bytes) -> tuple[bytes, ...]:
+    """Return the page as pre-encoded template segments around the dynamic parts."""
+    return (PAGE_PREFIX, _esc(part_num).encode("utf-8"), PAGE_MIDDLE, content, PAGE_SUFFIX)
+
+
+def render_page_bytes(part_num: str, content: bytes) -> bytes:
+    """Render the HTML page by joining the pre-encoded template segments."""
+    return b"".join(render_page_parts(part_num, content))
+
+
+# The landing page and the missing-key notice never change, so build them once.
+_EMPTY_PAGE = render_page_bytes("", b"")
+_EMPTY_PAGE_ETAG = f'"{hashlib.md5(_EMPTY_PAGE, usedforsecurity=False).hexdigest()}"'
+_NOT_FOUND = b"Not Found"
+_MISSING_API_KEY_HTML = b'<p class="error">REBRICKABLE_API_KEY is not set.</p>'
+
+
+def _part_num_from_query(query: str) -> str:
+    """Return the first part_num value; the form has no other fields to parse."""
+    for pair in query.split("&"):
+        # Blank values are skipped, as parse_qs does.
+        if pair.startswith("part_num=") and len(pair) > len("part_num="):
+            return unquote_plus(pair[len("part_num="):]).strip()
+    return ""
+
+
+def _write_chunks(sock: Any, wfile: Any, chunks: tuple[bytes, ...]) -> None:
+    """Write all chunks with scatter/gather sendmsg, or one by one without it."""
+    if not hasattr(sock, "sendmsg"):
+        for chunk in chunks:
+            wfile.write(chunk)
+        return
+
+    views = [memoryview(chunk) for chunk in chunks if chunk]
+    while views:
+        sent = sock.sendmsg(views)
+        # Drop fully sent buffers and trim a partially sent one.
+        while sent and views:
+            size = len(views[0])
+            if sent >= size:
+                sent -= size
+                views.pop(0)
+            else:
+                views[0] = views[0][sent:]
+                sent = 0
 
 
 class RebrickableHandler(BaseHTTPRequestHandler):
+    # Keep browser connections open between lookups; every response below
+    # carries an exact Content-Length (or, for 304, no body at all).
+    protocol_version = "HTTP/1.1"
+    # Close keep-alive sockets that stay idle, so they don't pin a server thread.
+    timeout = 45
+    # Headers and body go out in separate writes; don't let Nagle hold the body.
+    disable_nagle_algorithm = True
+
+    def _send_body(
+        self,
+        status: HTTPStatus,
+        content_type: str,
+        *chunks: bytes,
+        etag: str | None = None,
+    ) -> None:
+        """Send a response whose body is written chunk by chunk, never joined."""
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(sum(len(chunk) for chunk in chunks)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        _write_chunks(self.request, self.wfile, chunks)
+
+    def _send_empty_page(self) -> None:
+        if _EMPTY_PAGE_ETAG in self.headers.get("If-None-Match", ""):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", _EMPTY_PAGE_ETAG)
+            self.end_headers()
+            return
+        self._send_body(HTTPStatus.OK, "text/html; charset=utf-8", _EMPTY_PAGE, etag=_EMPTY_PAGE_ETAG)
+
+    def _send_raw_json(self, part_num: str) -> None:
+        """Serve the pretty-printed part payload behind the raw JSON toggle."""
+        api_key = _api_key()
+        if not api_key:
+            self._send_body(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                "text/plain; charset=utf-8",
+                b"REBRICKABLE_API_KEY is not set.",
+            )
+            return
+
+        try:
+            body = _raw_json_bytes(part_num, api_key, cache_epoch())
+        except Exception as exc:  # pragma: no cover - basic handler
+            detail = str(exc)
+            if "CERTIFICATE_VERIFY_FAILED" in detail:
+                detail = ssl_fix_hint()
+            self._send_body(
+                HTTPStatus.BAD_GATEWAY,
+                "text/plain; charset=utf-8",
+                f"Failed to fetch data: {detail}".encode("utf-8"),
+            )
+            return
+
+        self._send_body(
+            HTTPStatus.OK,
+            "application/json; charset=utf-8",
+            body,
+        )
+
     def do_GET(self) -> None:  # noqa: N802 - required by BaseHTTPRequestHandler
+        # The bare landing page is the most common hit; skip URL parsing for it.
+        if self.path == "/":
+            self._send_empty_page()
+            return
+
         parsed = urlparse(self.path)
-        query = parse_qs(parsed.query)
-        part_num = (query.get("part_num") or [""])[0].strip()
-
-        content = ""
-        if part_num:
-            load_env_file(ENV_FILE)
-            api_key = os.environ.get("REBRICKABLE_API_KEY")
-            if not api_key:
-                content = "<p class=\"error\">REBRICKABLE_API_KEY is not set.</p>"
-            else:
-                try:
-                    data = fetch_path(
-                        f"lego/parts/{part_num}/",
-                        {},
-                        api_key,
-                    )
-                    colors_data = fetch_path(
-                        f"lego/parts/{part_num}/colors/",
-                        {},
-                        api_key,
-                    )
-                    colors_data = enrich_colors_with_rgb(colors_data, api_key)
-                    content = render_part_table(data, colors_data)
-                except Exception as exc:  # pragma: no cover - basic handler
-                    detail = str(exc)
-                    if "CERTIFICATE_VERIFY_FAILED" in detail:
-                        detail = ssl_fix_hint()
-                    content = (
-                        "<p class=\"error\">"
-                        f"Failed to fetch data: {html.escape(detail)}"
-                        "</p>"
-                    )
-
-        page = render_page(part_num, content)
-        encoded = page.encode("utf-8")
-
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(encoded)))
-        self.end_headers()
-        self.wfile.write(encoded)
+        if parsed.path.startswith(RAW_JSON_PREFIX) and parsed.path.endswith(RAW_JSON_SUFFIX):
+            raw_part_num = unquote(parsed.path[len(RAW_JSON_PREFIX):-len(RAW_JSON_SUFFIX)]).strip()
+            if raw_part_num:
+                self._send_raw_json(raw_part_num)
+                return
+
+        if parsed.path not in ("/", ""):
+            # Browsers ask for /favicon.ico after every page; answer without rendering.
+            if parsed.path == "/favicon.ico":
+                self.send_response(HTTPStatus.NO_CONTENT)
+                self.end_headers()
+                return
+            self._send_body(HTTPStatus.NOT_FOUND, "text/plain; charset=utf-8", _NOT_FOUND)
+            return
+
+        part_num = _part_num_from_query(parsed.query)
+
+        if not part_num:
+            self._send_empty_page()
+            return
+
+        api_key = _api_key()
+        if not api_key:
+            self._send_body(
+                HTTPStatus.OK,
+                "text/html; charset=utf-8",
+                *render_page_parts(part_num, _MISSING_API_KEY_HTML),
+            )
+            return
+
+        try:
+            colors_future = _FETCH_EXECUTOR.submit(
+                fetch_path,
+                f"lego/parts/{part_num}/colors/",
+                {},
+                api_key,
+            )
+            data = fetch_path(
+                f"lego/parts/{part_num}/",
+                {},
+                api_key,
+            )
+            colors_data = colors_future.result()
+            colors_data = enrich_colors_with_rgb(colors_data, api_key)
+            content = render_part_table(data, colors_data)
+        except Exception as exc:  # pragma: no cover - basic handler
+            detail = str(exc)
+            if "CERTIFICATE_VERIFY_FAILED" in detail:
+                detail = ssl_fix_hint()
+            content = (
+                "<p class=\"error\">"
+                f"Failed to fetch data: {_esc(detail)}"
+                "</p>"
+            ).encode("utf-8")
+
+        self._send_body(
+            HTTPStatus.OK,
+            "text/html; charset=utf-8",
+            *render_page_parts(part_num, content),
+        )
 
 
 def run_server(host: str, port: int) -> None:
-    server = HTTPServer((host, port), RebrickableHandler)
+    server = ThreadingHTTPServer((host, port), RebrickableHandler)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _reload_env)
     print(f"Serving on http://{host}:{port}")
     server.serve_forever()
 
 
 if __name__ == "__main__":
-    load_env_file(ENV_FILE)
+    _api_key()
     run_server("0.0.0.0", 8000)